@@ -10,16 +10,25 @@ import logging
 import json
 import os
 import time
+import atexit
+import copy
+import queue
+import functools
 import shutil
 import glob
+import gzip
+import random
 import asyncio
 from datetime import datetime
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from logging.handlers import QueueHandler, QueueListener
+import httpx
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, ChatMember
 from telegram.ext import (
     Application, CommandHandler, CallbackQueryHandler, 
     ContextTypes, ChatJoinRequestHandler
 )
-from telegram.error import BadRequest
+from telegram.error import BadRequest, Forbidden, RetryAfter
+from telegram.request import HTTPXRequest
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -38,6 +47,32 @@ CONFIG = {
     'REQUIRED_REFERRALS': int(os.environ.get('REQUIRED_REFERRALS', 3)),
     'REFERRAL_POINTS': int(os.environ.get('REFERRAL_POINTS', 1)),
     
+    # 💬 PROGRESS NOTIFICATIONS - referrals within this many seconds share one message (0 = off)
+    'PROGRESS_COALESCE_WINDOW': float(os.environ.get('PROGRESS_COALESCE_WINDOW', 10)),
+    
+    # 🧊 USER TIERING - inactive users move to a compressed cold archive (0 disables either)
+    'COLD_AFTER_DAYS': int(os.environ.get('COLD_AFTER_DAYS', 30)),
+    'TIERING_INTERVAL': int(os.environ.get('TIERING_INTERVAL', 3600)),
+    
+    # 🔁 JOIN DECISION RETRIES - backoff in seconds
+    'RETRY_INTERVAL': int(os.environ.get('RETRY_INTERVAL', 5)),
+    'RETRY_BASE_DELAY': int(os.environ.get('RETRY_BASE_DELAY', 5)),
+    'RETRY_MAX_DELAY': int(os.environ.get('RETRY_MAX_DELAY', 900)),
+    'RETRY_MAX_ATTEMPTS': int(os.environ.get('RETRY_MAX_ATTEMPTS', 12)),
+    'CIRCUIT_FAILURE_THRESHOLD': int(os.environ.get('CIRCUIT_FAILURE_THRESHOLD', 5)),
+    'CIRCUIT_COOLDOWN': int(os.environ.get('CIRCUIT_COOLDOWN', 60)),
+    
+    # 📝 LOGGING - fraction of high-volume INFO events kept
+    'LOG_LEVEL': os.environ.get('LOG_LEVEL', 'INFO').upper(),
+    'LOG_SAMPLE_RATE': float(os.environ.get('LOG_SAMPLE_RATE', 0.1)),
+    
+    # 🌐 BOT API CONNECTION - HTTP_VERSION "2" needs python-telegram-bot[http2]
+    'BOT_API_BASE_URL': os.environ.get('BOT_API_BASE_URL', "https://api.telegram.org"),
+    'HTTP_POOL_SIZE': int(os.environ.get('HTTP_POOL_SIZE', 256)),
+    'HTTP_KEEPALIVE': float(os.environ.get('HTTP_KEEPALIVE', 30)),
+    'HTTP_VERSION': os.environ.get('HTTP_VERSION', "1.1"),
+    'HTTP_TIMEOUT': float(os.environ.get('HTTP_TIMEOUT', 30)),
+    
     # ✨ SPIRITUAL EMOJIS
     'EMOJIS': {
         'om': '🕉️',
@@ -76,18 +111,137 @@ CONFIG = {
         'message': '💬',
         'group': '👥',
         'bot': '🤖',
-        'server': '🖥️'
+        'server': '🖥️',
+        'cold': '🧊'
     }
 }
 # ==================== CONFIG END ====================
 
-# Logging setup
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO
-)
+# ==================== LOGGING ====================
+
+class JsonFormatter(logging.Formatter):
+    """Render each record as one JSON line, including extra fields"""
+    
+    STANDARD_FIELDS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime', 'high_volume'}
+    
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in self.STANDARD_FIELDS:
+                entry[key] = value
+        if record.exc_info:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc_info'] = record.exc_text
+        if record.stack_info:
+            entry['stack_info'] = record.stack_info
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of INFO records marked high_volume"""
+    
+    def __init__(self, rate):
+        super().__init__()
+        self.rate = rate
+    
+    def filter(self, record):
+        if record.levelno > logging.INFO or not getattr(record, 'high_volume', False):
+            return True
+        return random.random() < self.rate
+
+class StructuredQueueHandler(QueueHandler):
+    """QueueHandler that keeps tracebacks as a separate field instead of in the message"""
+    
+    def prepare(self, record):
+        # Tracebacks can't cross threads safely, so render them here but keep them apart
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+def setup_logging():
+    """Queue log records for a background thread so handlers never block on log I/O"""
+    log_queue = queue.SimpleQueue()
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(JsonFormatter())
+    listener = QueueListener(log_queue, stream_handler)
+    
+    # Records below LOG_LEVEL or dropped by sampling are never formatted
+    queue_handler = StructuredQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(CONFIG['LOG_SAMPLE_RATE']))
+    
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(CONFIG['LOG_LEVEL'])
+    
+    # httpx logs every Bot API request at INFO
+    logging.getLogger('httpx').setLevel(logging.WARNING)
+    
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+log_listener = setup_logging()
 logger = logging.getLogger(__name__)
 
+# ==================== HTTP REQUEST LAYER ====================
+
+class TunedHTTPXRequest(HTTPXRequest):
+    """HTTPXRequest with a configurable keep-alive expiry for idle pooled connections"""
+    
+    # Relies on HTTPXRequest internals (python-telegram-bot 20.x), fail loudly if they change
+    PTB_INTERNALS_ERROR = (
+        "TunedHTTPXRequest needs HTTPXRequest._build_client() and _client_kwargs['limits'], "
+        "which this python-telegram-bot version no longer provides"
+    )
+    
+    def __init__(self, keepalive_expiry=5.0, **kwargs):
+        if not callable(getattr(HTTPXRequest, '_build_client', None)):
+            raise RuntimeError(self.PTB_INTERNALS_ERROR)
+        
+        self._keepalive_expiry = keepalive_expiry
+        self._keepalive_applied = False
+        super().__init__(**kwargs)
+        
+        if not self._keepalive_applied:
+            raise RuntimeError(self.PTB_INTERNALS_ERROR)
+    
+    def _build_client(self):
+        client_kwargs = getattr(self, '_client_kwargs', None)
+        if not isinstance(client_kwargs, dict) or not isinstance(client_kwargs.get('limits'), httpx.Limits):
+            raise RuntimeError(self.PTB_INTERNALS_ERROR)
+        
+        limits = self._client_kwargs['limits']
+        self._client_kwargs['limits'] = httpx.Limits(
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=self._keepalive_expiry
+        )
+        self._keepalive_applied = True
+        return super()._build_client()
+
+def build_request(pool_size, config=CONFIG):
+    """Create the HTTP request layer used for Bot API calls"""
+    timeout = config['HTTP_TIMEOUT']
+    return TunedHTTPXRequest(
+        connection_pool_size=pool_size,
+        keepalive_expiry=config['HTTP_KEEPALIVE'],
+        http_version=config['HTTP_VERSION'],
+        read_timeout=timeout,
+        write_timeout=timeout,
+        connect_timeout=timeout,
+        pool_timeout=timeout
+    )
+
 class DharmikReferralBot:
     """Dharmik Media Group Access Bot - Secure Railway Version"""
     
@@ -105,15 +259,42 @@ class DharmikReferralBot:
             os.makedirs(self.data_dir)
         
         self.user_data_file = os.path.join(self.data_dir, "dharmik_users.json")
+        self.cold_data_file = os.path.join(self.data_dir, "dharmik_users_cold.json.gz")
+        self.retry_queue_file = os.path.join(self.data_dir, "join_retry_queue.json")
         self.backup_dir = os.path.join(self.data_dir, "backups")
         
         self.validate_config()
         
+        # Hot/cold tiering state - cold archive is held in memory, None while unreadable
+        self.cold_users = self.load_cold_archive()
+        self.cold_reload_at = time.time()
+        self.cold_dirty = False
+        self.tiering_task = None
+        self.tier_stats = {
+            'hot_users': 0,
+            'cold_users': len(self.cold_users or {}),
+            'archived': 0,
+            'rehydrations': 0,
+            'rehydrate_ms_total': 0.0,
+            'rehydrate_ms_max': 0.0
+        }
+        
+        # Join decision retry state
+        self.retry_queue = self.load_retry_queue()
+        self.retry_queue_lock = asyncio.Lock()
+        self.retry_task = None
+        self.circuit = {'failures': 0, 'open_until': 0}
+        
+        # Coalesced referrer progress notifications
+        self.pending_progress = {}
+        self.sending_progress = {}
+        self.progress_stats = {'events': 0, 'sent': 0, 'failed': 0}
+        
         if not os.path.exists(self.backup_dir):
             os.makedirs(self.backup_dir)
         
-        logger.info(f"{self.emoji['om']} Bot initialized: @{self.config['BOT_USERNAME']}")
-        logger.info(f"{self.emoji['bot']} Running on Railway: {os.environ.get('RAILWAY_ENVIRONMENT', 'Local')}")
+        logger.info("Bot initialized: @%s", self.config['BOT_USERNAME'])
+        logger.info("Running on Railway: %s", os.environ.get('RAILWAY_ENVIRONMENT', 'Local'))
     
     def validate_config(self):
         """Validate configuration"""
@@ -153,26 +334,28 @@ class DharmikReferralBot:
                             os.remove(old_backup)
                         except:
                             pass
-                logger.info(f"{self.emoji['check']} Backup created: {backup_path}")
+                logger.info("Backup created: %s", backup_path, extra={'high_volume': True})
                 return True
         except Exception as e:
-            logger.error(f"Backup error: {e}")
+            logger.error("Backup error: %s", e)
         return False
     
     def load_user_data(self):
         """Load user data from file"""
         if not os.path.exists(self.user_data_file):
-            logger.info(f"{self.emoji['book']} Creating new user data file")
+            logger.info("Creating new user data file")
             return {}
         
         try:
             with open(self.user_data_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                logger.info(f"{self.emoji['check']} Loaded {len(data)} users")
-                return data
+                logger.info("Loaded %d users", len(data), extra={'users': len(data), 'high_volume': True})
         except Exception as e:
-            logger.error(f"Load error: {e}")
+            logger.error("Load error: %s", e)
             return {}
+        
+        self.tier_stats['hot_users'] = len(data)
+        return data
     
     def save_user_data(self, data):
         """Save user data to file"""
@@ -180,12 +363,163 @@ class DharmikReferralBot:
             self.create_backup()
             with open(self.user_data_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
-            logger.info(f"{self.emoji['check']} Saved {len(data)} users")
+            logger.info("Saved %d users", len(data), extra={'users': len(data), 'high_volume': True})
+            self.tier_stats['hot_users'] = len(data)
             return True
         except Exception as e:
-            logger.error(f"Save error: {e}")
+            logger.error("Save error: %s", e)
             return False
     
+    # ==================== USER TIERING ====================
+    
+    def load_cold_archive(self):
+        """Load archived users, returns None if the archive is unreadable"""
+        if not os.path.exists(self.cold_data_file):
+            return {}
+        
+        try:
+            with gzip.open(self.cold_data_file, 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error("Cold archive load error: %s", e)
+            return None
+    
+    def save_cold_archive(self, data):
+        """Save archived users to compressed file"""
+        try:
+            tmp_file = f"{self.cold_data_file}.tmp"
+            with gzip.open(tmp_file, 'wt', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_file, self.cold_data_file)
+            return True
+        except Exception as e:
+            logger.error("Cold archive save error: %s", e)
+            return False
+    
+    def is_inactive(self, info, now):
+        """Check if user is past the cold horizon with no pending referral progress"""
+        refs = len(info.get('referrals', []))
+        if 0 < refs < self.config['REQUIRED_REFERRALS']:
+            return False
+        
+        # Rehydration counts as activity so a user isn't archived straight back
+        timestamps = [info.get('last_activity'), info.get('rehydrated_at')]
+        try:
+            last_seen = max(datetime.fromisoformat(ts) for ts in timestamps if ts)
+        except ValueError:
+            return False
+        
+        return (now - last_seen).days >= self.config['COLD_AFTER_DAYS']
+    
+    def merge_user_records(self, old, new):
+        """Combine two copies of a user without dropping referral progress"""
+        merged = {**old, **new}
+        merged['referrals'] = list(dict.fromkeys(old.get('referrals', []) + new.get('referrals', [])))
+        merged['points'] = max(old.get('points', 0), new.get('points', 0))
+        return merged
+    
+    def archive_inactive_users(self, data):
+        """Copy inactive users into the in-memory cold archive, returns their ids"""
+        now = datetime.now()
+        inactive = [uid for uid, info in data.items() if self.is_inactive(info, now)]
+        
+        for uid in inactive:
+            if uid in self.cold_users:
+                self.cold_users[uid] = self.merge_user_records(self.cold_users[uid], data[uid])
+            else:
+                self.cold_users[uid] = data[uid]
+        
+        if inactive:
+            self.cold_dirty = True
+        return inactive
+    
+    def reload_cold_archive(self):
+        """Retry loading an unreadable cold archive, at most once a minute"""
+        if time.time() - self.cold_reload_at < 60:
+            return
+        
+        self.cold_reload_at = time.time()
+        self.cold_users = self.load_cold_archive()
+        if self.cold_users is not None:
+            self.tier_stats['cold_users'] = len(self.cold_users)
+            logger.info("Cold archive recovered with %d users", len(self.cold_users))
+    
+    async def run_tiering(self):
+        """Move inactive users to the cold archive and persist it"""
+        if self.cold_users is None:
+            self.reload_cold_archive()
+            if self.cold_users is None:
+                return
+        
+        data = self.load_user_data()
+        
+        # Users saved back to the hot file after rehydration no longer need a cold copy
+        for uid in [uid for uid in data if uid in self.cold_users]:
+            del self.cold_users[uid]
+            self.cold_dirty = True
+        
+        archived = self.archive_inactive_users(data) if self.config['COLD_AFTER_DAYS'] > 0 else []
+        
+        # Cold archive is written first so a failed hot save never loses users
+        if self.cold_dirty:
+            self.cold_dirty = False
+            if not await asyncio.to_thread(self.save_cold_archive, copy.deepcopy(self.cold_users)):
+                self.cold_dirty = True
+                return
+        self.tier_stats['cold_users'] = len(self.cold_users)
+        
+        if not archived:
+            return
+        
+        # Handlers may have saved while the archive was written, so re-read before removing
+        data = self.load_user_data()
+        now = datetime.now()
+        removed = [uid for uid in archived if uid in data and self.is_inactive(data[uid], now)]
+        if not removed:
+            return
+        
+        for uid in removed:
+            del data[uid]
+        self.save_user_data(data)
+        
+        self.tier_stats['archived'] += len(removed)
+        logger.info("Archived %d inactive users", len(removed), extra={'users': len(removed)})
+    
+    async def tiering_worker(self):
+        """Background loop running the hot/cold tiering pass"""
+        while True:
+            try:
+                await self.run_tiering()
+            except Exception as e:
+                logger.error("Tiering worker error: %s", e)
+            await asyncio.sleep(self.config['TIERING_INTERVAL'])
+    
+    def rehydrate_user(self, data, user_id):
+        """Bring a cold user back into hot data, returns None if the cold archive is unreadable"""
+        if user_id in data:
+            return True
+        if self.cold_users is None:
+            self.reload_cold_archive()
+            if self.cold_users is None:
+                return None
+        if user_id not in self.cold_users:
+            return False
+        
+        # Cold copy is dropped by the next tiering pass once the hot file holds the user
+        started = time.perf_counter()
+        data[user_id] = copy.deepcopy(self.cold_users[user_id])
+        data[user_id]['rehydrated_at'] = datetime.now().isoformat()
+        
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.tier_stats['rehydrations'] += 1
+        self.tier_stats['rehydrate_ms_total'] += elapsed_ms
+        self.tier_stats['rehydrate_ms_max'] = max(self.tier_stats['rehydrate_ms_max'], elapsed_ms)
+        logger.info(
+            "Rehydrated %s in %.3fms", user_id, elapsed_ms,
+            extra={'user_id': user_id, 'duration_ms': round(elapsed_ms, 3)}
+        )
+        return True
+    
     def get_referral_link(self, user_id):
         """Generate referral link for user"""
         username = self.config['BOT_USERNAME']
@@ -202,25 +536,249 @@ class DharmikReferralBot:
                    .replace('>', '&gt;')
                    .replace('"', '&quot;'))
     
-    async def approve_channel_request(self, user_id, context: ContextTypes.DEFAULT_TYPE):
+    async def approve_channel_request(self, user_id, context: ContextTypes.DEFAULT_TYPE, request_key=None):
         """Approve user to Dharmik Channel"""
+        return await self.decide_join_request('approve', user_id, request_key, context.bot)
+    
+    async def decline_channel_request(self, user_id, context: ContextTypes.DEFAULT_TYPE, request_key=None):
+        """Decline user from channel"""
+        return await self.decide_join_request('decline', user_id, request_key, context.bot)
+    
+    async def send_approval_message(self, user_id, bot):
+        """Tell user their channel access was approved"""
         try:
-            await context.bot.approve_chat_join_request(self.config['CHANNEL_ID'], user_id)
-            logger.info(f"{self.emoji['check']} Approved {user_id} to Dharmik Channel")
-            return True
+            keyboard = [
+                [InlineKeyboardButton(
+                    f"{self.emoji['temple']} Open Channel", 
+                    url=self.config['DHARMIK_CHANNEL_LINK']
+                )]
+            ]
+            reply_markup = InlineKeyboardMarkup(keyboard)
+            
+            await bot.send_message(
+                chat_id=int(user_id),
+                text=f"{self.emoji['celebration']} <b>Your channel access has been approved!</b>\n\n"
+                     f"{self.emoji['temple']} Welcome to Dharma Darshan Channel!\n\n"
+                     f"{self.emoji['heart']} <i>May your spiritual journey be blessed!</i>",
+                reply_markup=reply_markup,
+                parse_mode='HTML'
+            )
+        except:
+            pass
+    
+    # ==================== JOIN DECISION RETRY QUEUE ====================
+    
+    def load_retry_queue(self):
+        """Load pending and completed join decisions from file"""
+        retry_queue = {'pending': {}, 'done': {}}
+        if not os.path.exists(self.retry_queue_file):
+            return retry_queue
+        
+        try:
+            with open(self.retry_queue_file, 'r', encoding='utf-8') as f:
+                retry_queue.update(json.load(f))
         except Exception as e:
-            logger.error(f"Approve error: {e}")
-            return False
+            logger.error("Retry queue load error: %s", e)
+        return retry_queue
     
-    async def decline_channel_request(self, user_id, context: ContextTypes.DEFAULT_TYPE):
-        """Decline user from channel"""
+    def write_retry_queue(self, queue_data):
+        """Write join decisions to file in compact form"""
         try:
-            await context.bot.decline_chat_join_request(self.config['CHANNEL_ID'], user_id)
-            logger.info(f"{self.emoji['warning']} Declined {user_id}")
-            return True
+            tmp_file = f"{self.retry_queue_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(queue_data, f, separators=(',', ':'))
+            os.replace(tmp_file, self.retry_queue_file)
         except Exception as e:
-            logger.error(f"Decline error: {e}")
+            logger.error("Retry queue save error: %s", e)
+    
+    async def save_retry_queue(self):
+        """Save join decisions off the event loop, pruning completed keys older than a week"""
+        cutoff = time.time() - 7 * 86400
+        self.retry_queue['done'] = {
+            key: ts for key, ts in self.retry_queue['done'].items() if ts >= cutoff
+        }
+        
+        snapshot = {
+            'pending': {key: dict(item) for key, item in self.retry_queue['pending'].items()},
+            'done': dict(self.retry_queue['done'])
+        }
+        async with self.retry_queue_lock:
+            await asyncio.to_thread(self.write_retry_queue, snapshot)
+    
+    def is_already_participant(self, action, error):
+        """Check if an approve failed because the user is already in the channel"""
+        return action == 'approve' and 'USER_ALREADY_PARTICIPANT' in str(error).upper()
+    
+    def is_request_missing(self, action, error):
+        """Check if an approve failed because the join request no longer exists"""
+        return action == 'approve' and 'HIDE_REQUESTER_MISSING' in str(error).upper()
+    
+    async def is_channel_member(self, bot, user_id):
+        """Check with the Bot API whether user is currently in the channel"""
+        try:
+            member = await bot.get_chat_member(self.config['CHANNEL_ID'], int(user_id))
+        except Exception as e:
+            logger.error("Membership check error: %s", e, extra={'user_id': str(user_id)})
             return False
+        
+        if member.status == ChatMember.RESTRICTED:
+            return member.is_member
+        return member.status in (ChatMember.MEMBER, ChatMember.ADMINISTRATOR, ChatMember.OWNER)
+    
+    def referral_count(self, user_id):
+        """Current referral count for user from hot data or the cold archive"""
+        info = self.load_user_data().get(user_id) or (self.cold_users or {}).get(user_id) or {}
+        return len(info.get('referrals', []))
+    
+    def circuit_allows(self):
+        """Check if Bot API calls are allowed by the circuit breaker"""
+        return time.time() >= self.circuit['open_until']
+    
+    def record_api_success(self):
+        """Close the circuit breaker after a successful call"""
+        if self.circuit['failures'] >= self.config['CIRCUIT_FAILURE_THRESHOLD']:
+            logger.info("Circuit closed, Bot API recovered")
+        self.circuit = {'failures': 0, 'open_until': 0}
+    
+    def record_api_failure(self):
+        """Count a failed call, opening the circuit breaker past the threshold"""
+        self.circuit['failures'] += 1
+        if self.circuit['failures'] >= self.config['CIRCUIT_FAILURE_THRESHOLD']:
+            self.circuit['open_until'] = time.time() + self.config['CIRCUIT_COOLDOWN']
+            logger.warning(
+                "Circuit open after %d failures, pausing retries for %ds",
+                self.circuit['failures'], self.config['CIRCUIT_COOLDOWN']
+            )
+    
+    def retry_delay(self, attempts, error):
+        """Exponential backoff with jitter, honouring Telegram flood waits"""
+        cap = min(self.config['RETRY_MAX_DELAY'], self.config['RETRY_BASE_DELAY'] * 2 ** (attempts - 1))
+        delay = cap / 2 + random.uniform(0, cap / 2)
+        if isinstance(error, RetryAfter):
+            delay = max(delay, float(error.retry_after))
+        return delay
+    
+    async def execute_join_decision(self, bot, action, user_id):
+        """Send approve/decline to the Bot API, raises on failure"""
+        if action == 'approve':
+            await bot.approve_chat_join_request(self.config['CHANNEL_ID'], int(user_id))
+            logger.info("Approved %s to Dharmik Channel", user_id, extra={'user_id': user_id})
+        else:
+            await bot.decline_chat_join_request(self.config['CHANNEL_ID'], int(user_id))
+            logger.info("Declined %s", user_id, extra={'user_id': user_id})
+    
+    async def decide_join_request(self, action, user_id, request_key, bot):
+        """Approve/decline a join request, queueing it for retry on transient failure"""
+        user_id = str(user_id)
+        key = f"{action}:{user_id}:{request_key}"
+        if key in self.retry_queue['done']:
+            return True
+        
+        item = {
+            'key': key,
+            'action': action,
+            'user_id': user_id,
+            'attempts': 0,
+            'next_attempt': time.time(),
+            'last_error': "Circuit open",
+            'created_at': datetime.now().isoformat()
+        }
+        
+        if self.circuit_allows():
+            try:
+                await self.execute_join_decision(bot, action, user_id)
+            except (BadRequest, Forbidden) as e:
+                if not self.is_already_participant(action, e):
+                    logger.error("%s error: %s", action.title(), e, extra={'user_id': user_id})
+                    return False
+                self.retry_queue['done'][key] = time.time()
+                return True
+            except Exception as e:
+                logger.error("%s error: %s", action.title(), e, extra={'user_id': user_id})
+                self.record_api_failure()
+                item['attempts'] = 1
+                item['last_error'] = str(e)
+                item['next_attempt'] = time.time() + self.retry_delay(1, e)
+            else:
+                # Only kept in memory, persisted with the next pending change
+                self.record_api_success()
+                self.retry_queue['done'][key] = time.time()
+                return True
+        
+        self.retry_queue['pending'][key] = item
+        await self.save_retry_queue()
+        logger.warning("Queued %s for %s for retry", action, user_id, extra={'user_id': user_id})
+        return False
+    
+    async def retry_join_decision(self, bot, item):
+        """Retry one queued join decision"""
+        key = item['key']
+        
+        # Decline acts on the user's current request, so skip it if they qualify by now
+        if item['action'] == 'decline' and self.referral_count(item['user_id']) >= self.config['REQUIRED_REFERRALS']:
+            logger.info("Retry decline dropped for %s, now eligible", item['user_id'], extra={'user_id': item['user_id']})
+            del self.retry_queue['pending'][key]
+            await self.save_retry_queue()
+            return
+        
+        try:
+            await self.execute_join_decision(bot, item['action'], item['user_id'])
+        except (BadRequest, Forbidden) as e:
+            del self.retry_queue['pending'][key]
+            already_applied = (
+                (self.is_already_participant(item['action'], e) or self.is_request_missing(item['action'], e))
+                and await self.is_channel_member(bot, item['user_id'])
+            )
+            if already_applied:
+                # An earlier attempt timed out after Telegram had already approved
+                logger.info("Retry approve for %s already applied: %s", item['user_id'], e, extra={'user_id': item['user_id']})
+                self.retry_queue['done'][key] = time.time()
+                await self.send_approval_message(item['user_id'], bot)
+            else:
+                # Request gone or already handled, nothing left to retry
+                logger.error("Retry %s dropped for %s: %s", item['action'], item['user_id'], e, extra={'user_id': item['user_id']})
+        except Exception as e:
+            self.record_api_failure()
+            item['attempts'] += 1
+            item['last_error'] = str(e)
+            if item['attempts'] >= self.config['RETRY_MAX_ATTEMPTS']:
+                logger.error(
+                    "Retry %s gave up for %s after %d attempts: %s",
+                    item['action'], item['user_id'], item['attempts'], e,
+                    extra={'user_id': item['user_id']}
+                )
+                del self.retry_queue['pending'][key]
+            else:
+                item['next_attempt'] = time.time() + self.retry_delay(item['attempts'], e)
+        else:
+            self.record_api_success()
+            del self.retry_queue['pending'][key]
+            self.retry_queue['done'][key] = time.time()
+            if item['action'] == 'approve':
+                await self.send_approval_message(item['user_id'], bot)
+        
+        await self.save_retry_queue()
+    
+    async def process_retry_queue(self, bot):
+        """Retry all due join decisions while the circuit allows"""
+        now = time.time()
+        due = sorted(
+            (item for item in self.retry_queue['pending'].values() if item['next_attempt'] <= now),
+            key=lambda item: item['next_attempt']
+        )
+        for item in due:
+            if not self.circuit_allows():
+                break
+            await self.retry_join_decision(bot, item)
+    
+    async def retry_worker(self, bot):
+        """Background loop driving the join decision retry queue"""
+        while True:
+            await asyncio.sleep(self.config['RETRY_INTERVAL'])
+            try:
+                await self.process_retry_queue(bot)
+            except Exception as e:
+                logger.error("Retry worker error: %s", e)
     
     async def send_completion_message(self, user_id, context: ContextTypes.DEFAULT_TYPE):
         """Send beautiful completion message for Dharmik Channel"""
@@ -277,29 +835,116 @@ class DharmikReferralBot:
             
             return True
         except Exception as e:
-            logger.error(f"Completion message error: {e}")
+            logger.error("Completion message error: %s", e, extra={'user_id': user_id})
             return False
     
-    async def send_progress_update(self, user_id, new_count, context: ContextTypes.DEFAULT_TYPE):
+    async def send_progress_update(self, user_id, new_count, bot, new_referrals=1):
         """Send progress update when user gets new referral (EXACT ORIGINAL MESSAGE)"""
+        if new_referrals == 1:
+            header = (
+                f"{self.emoji['flower']} <b>NEW REFERRAL RECEIVED!</b>\n\n"
+                f"{self.emoji['gift']} <b>+1 Virtue Point Earned!</b>\n\n"
+            )
+        else:
+            header = (
+                f"{self.emoji['flower']} <b>{new_referrals} NEW REFERRALS RECEIVED!</b>\n\n"
+                f"{self.emoji['gift']} <b>+{new_referrals} Virtue Points Earned!</b>\n\n"
+            )
+        
         progress_msg = (
-            f"{self.emoji['flower']} <b>NEW REFERRAL RECEIVED!</b>\n\n"
-            f"{self.emoji['gift']} <b>+1 Virtue Point Earned!</b>\n\n"
+            f"{header}"
             f"{self.emoji['target']} <b>Your Progress:</b>\n"
             f"• {self.emoji['users']} Referrals: {new_count}/{self.config['REQUIRED_REFERRALS']}\n"
-            f"• {self.emoji['star']} Virtue Points: +1\n\n"
+            f"• {self.emoji['star']} Virtue Points: +{new_referrals}\n\n"
             f"{self.emoji['bell']} <b>Need {self.config['REQUIRED_REFERRALS'] - new_count} more referrals</b>\n\n"
             f"{self.emoji['heart']} <i>Keep Share And Support Us </i>"
         )
         
         try:
-            await context.bot.send_message(
+            await bot.send_message(
                 chat_id=int(user_id),
                 text=progress_msg,
                 parse_mode='HTML'
             )
+            self.progress_stats['sent'] += 1
         except Exception as e:
-            logger.error(f"Progress update error: {e}")
+            self.progress_stats['failed'] += 1
+            logger.error("Progress update error: %s", e, extra={'user_id': user_id})
+    
+    async def queue_progress_update(self, user_id, new_count, bot):
+        """Merge progress updates for a referrer arriving within the coalesce window"""
+        self.progress_stats['events'] += 1
+        
+        if self.config['PROGRESS_COALESCE_WINDOW'] <= 0:
+            await self.send_progress_update(user_id, new_count, bot)
+            return
+        
+        pending = self.pending_progress.get(user_id)
+        if pending:
+            pending['new_referrals'] += 1
+            pending['new_count'] = new_count
+            return
+        
+        self.pending_progress[user_id] = {
+            'new_referrals': 1,
+            'new_count': new_count,
+            'task': asyncio.create_task(self.flush_progress_update(user_id, bot))
+        }
+    
+    async def flush_progress_update(self, user_id, bot):
+        """Send the merged progress update once the coalesce window closes"""
+        await asyncio.sleep(self.config['PROGRESS_COALESCE_WINDOW'])
+        pending = self.pending_progress.pop(user_id, None)
+        if not pending:
+            return
+        
+        # Tracked while sending so a completion can wait for it instead of overtaking it
+        self.sending_progress[user_id] = pending
+        try:
+            refs = len(self.load_user_data().get(user_id, {}).get('referrals', []))
+            if refs < self.config['REQUIRED_REFERRALS']:
+                await self.send_progress_update(user_id, pending['new_count'], bot, pending['new_referrals'])
+        finally:
+            self.sending_progress.pop(user_id, None)
+    
+    async def cancel_progress_update(self, user_id):
+        """Drop a pending progress update superseded by the completion message"""
+        pending = self.pending_progress.pop(user_id, None)
+        if pending:
+            pending['task'].cancel()
+        
+        sending = self.sending_progress.get(user_id)
+        if sending:
+            await sending['task']
+    
+    async def flush_all_progress_updates(self, bot):
+        """Send every pending progress update immediately"""
+        for user_id in list(self.pending_progress):
+            pending = self.pending_progress.pop(user_id)
+            pending['task'].cancel()
+            await self.send_progress_update(user_id, pending['new_count'], bot, pending['new_referrals'])
+        for sending in list(self.sending_progress.values()):
+            await sending['task']
+    
+    def timed(self, handler):
+        """Wrap a handler to log its duration as a structured record"""
+        @functools.wraps(handler)
+        async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
+            started = time.perf_counter()
+            try:
+                return await handler(update, context)
+            finally:
+                user = update.effective_user
+                logger.info(
+                    "Handled %s", handler.__name__,
+                    extra={
+                        'handler': handler.__name__,
+                        'user_id': str(user.id) if user else None,
+                        'duration_ms': round((time.perf_counter() - started) * 1000, 2),
+                        'high_volume': True
+                    }
+                )
+        return wrapper
     
     # ==================== MAIN COMMANDS ====================
     
@@ -309,7 +954,12 @@ class DharmikReferralBot:
         user_id = str(user.id)
         user_data = self.load_user_data()
         
-        logger.info(f"{self.emoji['gate']} New user: {user_id} - {user.first_name}")
+        # Unreadable cold archive - the user may be archived, so don't register them as new
+        if self.rehydrate_user(user_data, user_id) is None:
+            await update.message.reply_text(f"{self.emoji['warning']} Please try again in a few minutes")
+            return
+        
+        logger.info("New user: %s - %s", user_id, user.first_name, extra={'user_id': user_id, 'high_volume': True})
         
         # ✅ PROCESS REFERRAL
         if context.args and len(context.args) > 0:
@@ -317,7 +967,7 @@ class DharmikReferralBot:
             
             if (referrer_id.isdigit() and 
                 referrer_id != user_id and 
-                referrer_id in user_data):
+                self.rehydrate_user(user_data, referrer_id)):
                 
                 # Check if not already referred
                 if 'referrals' not in user_data[referrer_id]:
@@ -340,11 +990,12 @@ class DharmikReferralBot:
                     # Send notification if needed
                     if old_count < self.config['REQUIRED_REFERRALS']:
                         if new_count < self.config['REQUIRED_REFERRALS']:
-                            # Progress update (for 1st and 2nd referral)
-                            await self.send_progress_update(referrer_id, new_count, context)
+                            # Progress update (for 1st and 2nd referral), merged during bursts
+                            await self.queue_progress_update(referrer_id, new_count, context.bot)
                         
                         elif new_count == self.config['REQUIRED_REFERRALS']:
                             # Completion! (for 3rd referral) - TWO MESSAGES WITH BUTTON
+                            await self.cancel_progress_update(referrer_id)
                             await self.send_completion_message(referrer_id, context)
         
         # Register/update user
@@ -412,9 +1063,13 @@ class DharmikReferralBot:
             message = update.message
         
         user_data = self.load_user_data()
+        found = self.rehydrate_user(user_data, user_id)
         
-        if user_id not in user_data:
-            text = f"{self.emoji['warning']} Please use /start first"
+        if not found:
+            if found is None:
+                text = f"{self.emoji['warning']} Please try again in a few minutes"
+            else:
+                text = f"{self.emoji['warning']} Please use /start first"
             if query:
                 await query.edit_message_text(text)
             else:
@@ -486,8 +1141,12 @@ class DharmikReferralBot:
         
         user_id = str(query.from_user.id)
         user_data = self.load_user_data()
+        found = self.rehydrate_user(user_data, user_id)
         
-        if user_id not in user_data:
+        if found is None:
+            await query.edit_message_text(f"{self.emoji['warning']} Please try again in a few minutes")
+            return
+        if not found:
             await query.edit_message_text(f"{self.emoji['warning']} Please use /start first")
             return
         
@@ -583,13 +1242,14 @@ class DharmikReferralBot:
             return
         
         user_data = self.load_user_data()
-        total_users = len(user_data)
+        all_users = {**(self.cold_users or {}), **user_data}
+        total_users = len(all_users)
         
         completed = 0
         total_refs = 0
         recent_users = 0
         
-        for uid, info in user_data.items():
+        for uid, info in all_users.items():
             refs = len(info.get('referrals', []))
             total_refs += refs
             if refs >= self.config['REQUIRED_REFERRALS']:
@@ -607,13 +1267,34 @@ class DharmikReferralBot:
         
         pending = total_users - completed
         
+        tiers = self.tier_stats
+        progress = self.progress_stats
+        pending_progress = sum(
+            p['new_referrals'] for p in [*self.pending_progress.values(), *self.sending_progress.values()]
+        )
+        progress_saved = progress['events'] - pending_progress - progress['sent'] - progress['failed']
+        
+        avg_rehydrate = tiers['rehydrate_ms_total'] / tiers['rehydrations'] if tiers['rehydrations'] else 0
+        archive_warning = (
+            f"⚠️ <b>Cold archive unreadable</b> - new and returning seekers are asked to retry, see logs\n\n"
+            if self.cold_users is None else ""
+        )
+        
         stats = (
             f"{self.emoji['admin']} <b>ADMIN STATISTICS</b>\n\n"
+            f"{archive_warning}"
             f"{self.emoji['users']} <b>Total Seekers:</b> {total_users}\n"
             f"{self.emoji['check']} <b>Completed Mission:</b> {completed}\n"
             f"{self.emoji['clock']} <b>In Progress:</b> {pending}\n"
             f"{self.emoji['link']} <b>Total Referrals:</b> {total_refs}\n"
             f"{self.emoji['message']} <b>Active (24h):</b> {recent_users}\n\n"
+            f"{self.emoji['fire']} <b>Hot Users:</b> {tiers['hot_users']}\n"
+            f"{self.emoji['cold']} <b>Cold Users:</b> {tiers['cold_users']} (archived {tiers['archived']})\n"
+            f"{self.emoji['refresh']} <b>Rehydrations:</b> {tiers['rehydrations']} "
+            f"(in-memory copy avg {avg_rehydrate:.3f}ms, max {tiers['rehydrate_ms_max']:.3f}ms)\n"
+            f"{self.emoji['message']} <b>Progress Msgs:</b> {progress['sent']} sent, {progress_saved} saved "
+            f"({self.config['PROGRESS_COALESCE_WINDOW']:g}s window)\n"
+            f"{self.emoji['clock']} <b>Join Retries Pending:</b> {len(self.retry_queue['pending'])} (/retries)\n\n"
             f"{self.emoji['target']} <b>Target:</b> {self.config['REQUIRED_REFERRALS']} referrals per seeker\n"
             f"{self.emoji['temple']} <b>Channel:</b> Dharma Darshan\n"
             f"{self.emoji['bot']} <b>Bot:</b> @{self.config['BOT_USERNAME']}\n"
@@ -641,49 +1322,81 @@ class DharmikReferralBot:
         
         await self.admin_command(update, context)
     
+    async def retries_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Admin command to view outstanding join decision retries"""
+        user_id = str(update.effective_user.id)
+        
+        if user_id != self.config['ADMIN_USER_ID']:
+            await update.message.reply_text(f"{self.emoji['warning']} Admin only")
+            return
+        
+        pending = sorted(self.retry_queue['pending'].values(), key=lambda item: item['next_attempt'])
+        now = time.time()
+        
+        if self.circuit_allows():
+            circuit_state = f"{self.emoji['check']} Closed ({self.circuit['failures']} recent failures)"
+        else:
+            circuit_state = f"{self.emoji['lock']} Open for {int(self.circuit['open_until'] - now)}s"
+        
+        text = (
+            f"{self.emoji['admin']} <b>JOIN RETRY QUEUE</b>\n\n"
+            f"{self.emoji['server']} <b>Circuit:</b> {circuit_state}\n"
+            f"{self.emoji['clock']} <b>Outstanding:</b> {len(pending)}\n"
+            f"{self.emoji['check']} <b>Decided (7d):</b> {len(self.retry_queue['done'])}\n"
+        )
+        
+        if pending:
+            text += "\n"
+        for item in pending[:15]:
+            wait = max(0, int(item['next_attempt'] - now))
+            text += (
+                f"• <code>{item['user_id']}</code> {item['action']} - "
+                f"attempt {item['attempts']}, next in {wait}s\n"
+                f"  <i>{self.escape_html(item['last_error'][:80])}</i>\n"
+            )
+        if len(pending) > 15:
+            text += f"\n... and {len(pending) - 15} more"
+        
+        await update.message.reply_text(text, parse_mode='HTML')
+    
     async def handle_channel_join(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle Dharmik Channel join requests"""
         join_request = update.chat_join_request
         user_id = str(join_request.from_user.id)
         user_name = join_request.from_user.first_name or "User"
         
-        logger.info(f"{self.emoji['gate']} Channel join request from {user_id} ({user_name})")
+        logger.info("Channel join request from %s (%s)", user_id, user_name, extra={'user_id': user_id})
+        
+        # Same join request redelivered - decision already made or queued
+        request_key = int(join_request.date.timestamp())
+        for action in ('approve', 'decline'):
+            key = f"{action}:{user_id}:{request_key}"
+            if key in self.retry_queue['done'] or key in self.retry_queue['pending']:
+                logger.info("Join request from %s already handled", user_id, extra={'user_id': user_id})
+                return
         
         user_data = self.load_user_data()
+        found = self.rehydrate_user(user_data, user_id)
+        
+        # Leave the request pending rather than declining a possibly archived user
+        if found is None:
+            logger.error("Cold archive unavailable, leaving join request from %s pending", user_id, extra={'user_id': user_id})
+            return
         
-        if user_id in user_data:
+        if found:
             refs = len(user_data[user_id].get('referrals', []))
             
             if refs >= self.config['REQUIRED_REFERRALS']:
-                success = await self.approve_channel_request(int(user_id), context)
+                success = await self.approve_channel_request(int(user_id), context, request_key)
                 if success:
-                    logger.info(f"{self.emoji['gate']} Approved {user_id} to Dharmik Channel (has {refs} refs)")
-                    
-                    try:
-                        keyboard = [
-                            [InlineKeyboardButton(
-                                f"{self.emoji['temple']} Open Channel", 
-                                url=self.config['DHARMIK_CHANNEL_LINK']
-                            )]
-                        ]
-                        reply_markup = InlineKeyboardMarkup(keyboard)
-                        
-                        await context.bot.send_message(
-                            chat_id=int(user_id),
-                            text=f"{self.emoji['celebration']} <b>Your channel access has been approved!</b>\n\n"
-                                 f"{self.emoji['temple']} Welcome to Dharma Darshan Channel!\n\n"
-                                 f"{self.emoji['heart']} <i>May your spiritual journey be blessed!</i>",
-                            reply_markup=reply_markup,
-                            parse_mode='HTML'
-                        )
-                    except:
-                        pass
-                else:
-                    logger.error(f"{self.emoji['warning']} Failed to approve {user_id}")
+                    await self.send_approval_message(user_id, context.bot)
+                elif f"approve:{user_id}:{request_key}" not in self.retry_queue['pending']:
+                    # Queued retries are already logged by decide_join_request
+                    logger.error("Failed to approve %s", user_id, extra={'user_id': user_id})
             else:
-                await self.decline_channel_request(int(user_id), context)
+                await self.decline_channel_request(int(user_id), context, request_key)
                 needed = self.config['REQUIRED_REFERRALS'] - refs
-                logger.info(f"{self.emoji['warning']} Declined {user_id} (needs {needed} more refs)")
+                logger.info("Declined %s (needs %d more refs)", user_id, needed, extra={'user_id': user_id})
                 
                 try:
                     await context.bot.send_message(
@@ -697,8 +1410,8 @@ class DharmikReferralBot:
                 except:
                     pass
         else:
-            await self.decline_channel_request(int(user_id), context)
-            logger.info(f"{self.emoji['warning']} Declined unknown user {user_id}")
+            await self.decline_channel_request(int(user_id), context, request_key)
+            logger.info("Declined unknown user %s", user_id, extra={'user_id': user_id})
             
             try:
                 await context.bot.send_message(
@@ -713,32 +1426,55 @@ class DharmikReferralBot:
     
     def setup_handlers(self, application):
         """Setup all bot handlers"""
-        application.add_handler(CommandHandler("start", self.start))
-        application.add_handler(CommandHandler("status", self.status))
-        application.add_handler(CommandHandler("help", self.help_command))
-        application.add_handler(CommandHandler("admin", self.admin_command))
+        application.add_handler(CommandHandler("start", self.timed(self.start)))
+        application.add_handler(CommandHandler("status", self.timed(self.status)))
+        application.add_handler(CommandHandler("help", self.timed(self.help_command)))
+        application.add_handler(CommandHandler("admin", self.timed(self.admin_command)))
+        application.add_handler(CommandHandler("retries", self.timed(self.retries_command)))
         
         application.add_handler(ChatJoinRequestHandler(
-            self.handle_channel_join,
+            self.timed(self.handle_channel_join),
             chat_id=int(self.config['CHANNEL_ID'])
         ))
         
-        application.add_handler(CallbackQueryHandler(self.status, pattern="^status$"))
-        application.add_handler(CallbackQueryHandler(self.home, pattern="^home$"))
-        application.add_handler(CallbackQueryHandler(self.help_command, pattern="^help$"))
-        application.add_handler(CallbackQueryHandler(self.start_callback, pattern="^start_callback$"))
-        application.add_handler(CallbackQueryHandler(self.admin_refresh, pattern="^admin_refresh$"))
+        application.add_handler(CallbackQueryHandler(self.timed(self.status), pattern="^status$"))
+        application.add_handler(CallbackQueryHandler(self.timed(self.home), pattern="^home$"))
+        application.add_handler(CallbackQueryHandler(self.timed(self.help_command), pattern="^help$"))
+        application.add_handler(CallbackQueryHandler(self.timed(self.start_callback), pattern="^start_callback$"))
+        application.add_handler(CallbackQueryHandler(self.timed(self.admin_refresh), pattern="^admin_refresh$"))
+    
+    async def post_init(self, application):
+        """Start background workers once the bot is initialized"""
+        self.retry_task = asyncio.create_task(self.retry_worker(application.bot))
+        if self.config['TIERING_INTERVAL'] > 0:
+            self.tiering_task = asyncio.create_task(self.tiering_worker())
+        else:
+            logger.info("User tiering disabled (TIERING_INTERVAL=%s)", self.config['TIERING_INTERVAL'])
+    
+    async def post_stop(self, application):
+        """Stop background workers"""
+        if self.retry_task:
+            self.retry_task.cancel()
+        if self.tiering_task:
+            self.tiering_task.cancel()
+        await self.save_retry_queue()
+        await self.flush_all_progress_updates(application.bot)
     
     def run(self):
         """Start the Dharmik Bot on Railway"""
         self.validate_config()
         
+        base_url = self.config['BOT_API_BASE_URL'].rstrip('/')
+        
+        # getUpdates is a single long poll, so it gets its own one-connection pool
         app = Application.builder() \
             .token(self.config['BOT_TOKEN']) \
-            .read_timeout(30) \
-            .write_timeout(30) \
-            .connect_timeout(30) \
-            .pool_timeout(30) \
+            .base_url(f"{base_url}/bot") \
+            .base_file_url(f"{base_url}/file/bot") \
+            .request(build_request(self.config['HTTP_POOL_SIZE'], self.config)) \
+            .get_updates_request(build_request(1, self.config)) \
+            .post_init(self.post_init) \
+            .post_stop(self.post_stop) \
             .build()
         
         self.setup_handlers(app)
@@ -751,9 +1487,11 @@ class DharmikReferralBot:
         print(f"{self.emoji['temple']}  Channel: Dharma Darshan")
         print(f"{self.emoji['server']}  Server: Railway")
         print(f"{'='*60}")
+        print(f"{self.emoji['check']}  Bot API: {base_url} (pool {self.config['HTTP_POOL_SIZE']}, HTTP/{self.config['HTTP_VERSION']})")
         print(f"{self.emoji['check']}  Environment: {os.environ.get('RAILWAY_ENVIRONMENT', 'Development')}")
         print(f"{self.emoji['check']}  Data Directory: {self.data_dir}")
         print(f"{self.emoji['check']}  Users File: {self.user_data_file}")
+        print(f"{self.emoji['check']}  Cold Archive: {self.cold_data_file} ({self.config['COLD_AFTER_DAYS']}d horizon)")
         print(f"{'='*60}")
         print(f"{self.emoji['gate']}  Bot starting on Railway...")
         print(f"{'='*60}\n")
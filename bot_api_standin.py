@@ -0,0 +1,257 @@
+"""
+Local Bot API Stand-in - Dharma Darshan Bot
+Emulates the Telegram Bot API endpoints the bot uses, with configurable latency
+Used to measure end-to-end send throughput for each HTTP pool setting
+
+Serve only:
+    python bot_api_standin.py serve --port 8081 --latency 50
+    BOT_API_BASE_URL=http://127.0.0.1:8081 python bot.py
+
+Benchmark pool sizes against a stand-in started in a separate process:
+    python bot_api_standin.py bench --pool-sizes 1,8,32,256 --messages 2000 --latency 50
+
+Note: the stand-in speaks HTTP/1.1 only, so benchmark with HTTP_VERSION=1.1
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl
+
+from telegram import Bot
+
+from bot import CONFIG, build_request
+
+STANDIN_BOT = {
+    'id': 1000000001,
+    'is_bot': True,
+    'first_name': "Dharma Stand-in",
+    'username': "dharma_standin_bot",
+    'can_join_groups': True,
+    'can_read_all_group_messages': False,
+    'supports_inline_queries': False
+}
+
+class StandinServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding stand-in settings and call counters"""
+
+    daemon_threads = True
+    request_queue_size = 512
+
+    def __init__(self, address, latency=0.0, jitter=0.0, max_poll=1.0):
+        super().__init__(address, StandinHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.max_poll = max_poll
+        self.calls = {}
+        self.message_id = 0
+        self.lock = threading.Lock()
+
+    def next_message_id(self):
+        with self.lock:
+            self.message_id += 1
+            return self.message_id
+
+    def count(self, method):
+        with self.lock:
+            self.calls[method] = self.calls.get(method, 0) + 1
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Answer /bot<token>/<method> calls like the Bot API"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def read_params(self):
+        """Parse form or JSON body, decoding JSON-encoded form values"""
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode('utf-8') if length else ""
+        if not body:
+            return {}
+
+        if self.headers.get('Content-Type', '').startswith('application/json'):
+            return json.loads(body)
+
+        params = {}
+        for key, value in parse_qsl(body):
+            try:
+                params[key] = json.loads(value)
+            except ValueError:
+                params[key] = value
+        return params
+
+    def send_json(self, status, payload):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        try:
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            # Client went away mid long poll, e.g. bot shutting down
+            pass
+
+    def do_GET(self):
+        self.do_POST()
+
+    def do_POST(self):
+        server = self.server
+        method = self.path.rstrip('/').rsplit('/', 1)[-1]
+        params = self.read_params()
+        server.count(method)
+
+        time.sleep(server.latency + random.uniform(0, server.jitter))
+
+        if method == 'getMe':
+            result = STANDIN_BOT
+        elif method == 'sendMessage':
+            result = {
+                'message_id': server.next_message_id(),
+                'date': int(time.time()),
+                'chat': {'id': int(params.get('chat_id', 0)), 'type': 'private'},
+                'from': STANDIN_BOT,
+                'text': str(params.get('text', ""))
+            }
+        elif method in ('approveChatJoinRequest', 'declineChatJoinRequest', 'deleteWebhook'):
+            result = True
+        elif method == 'getUpdates':
+            # Long poll that never has updates, capped so shutdown stays quick
+            time.sleep(min(float(params.get('timeout', 0)), server.max_poll))
+            result = []
+        else:
+            self.send_json(404, {'ok': False, 'error_code': 404, 'description': "Not Found: method not found"})
+            return
+
+        self.send_json(200, {'ok': True, 'result': result})
+
+def start_server_process(host, port, latency, jitter):
+    """Start the stand-in in its own process so it doesn't share the GIL with the client"""
+    if not port:
+        with socket.socket() as sock:
+            sock.bind((host, 0))
+            port = sock.getsockname()[1]
+
+    process = subprocess.Popen(
+        [sys.executable, __file__, 'serve', '--host', host, '--port', str(port),
+         '--latency', str(latency), '--jitter', str(jitter)],
+        stdout=subprocess.DEVNULL
+    )
+
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Stand-in exited with code {process.returncode}")
+        try:
+            socket.create_connection((host, port), timeout=0.2).close()
+            return process, port
+        except OSError:
+            time.sleep(0.1)
+
+    process.terminate()
+    raise RuntimeError(f"Stand-in did not start on {host}:{port}")
+
+async def bench_pool(base_url, pool_size, messages, config):
+    """Send messages concurrently through one pool size, returns msgs/sec"""
+    bench_config = {**config, 'HTTP_TIMEOUT': None}
+    bot = Bot(
+        "123456:STANDIN",
+        base_url=f"{base_url}/bot",
+        request=build_request(pool_size, bench_config),
+        get_updates_request=build_request(1, bench_config)
+    )
+
+    async with bot:
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            bot.send_message(chat_id=100000 + i, text="Dharma bench") for i in range(messages)
+        ))
+        elapsed = time.perf_counter() - started
+
+    return messages / elapsed, elapsed
+
+async def run_bench(args):
+    if args.url:
+        base_url = args.url.rstrip('/')
+        server = None
+    else:
+        server, port = start_server_process(args.host, args.port, args.latency, args.jitter)
+        base_url = f"http://{args.host}:{port}"
+
+    config = {**CONFIG, 'HTTP_KEEPALIVE': args.keepalive, 'HTTP_VERSION': args.http_version}
+
+    print(f"\n{'='*60}")
+    print(f"Bot API: {base_url} | messages: {args.messages} | keep-alive: {args.keepalive}s | HTTP/{args.http_version}")
+    if not args.url and (os.cpu_count() or 1) < 2:
+        print("Warning: single CPU, client and stand-in share it so large pools will be CPU bound")
+    print(f"{'='*60}")
+    print(f"{'pool':>6}  {'msgs/sec':>10}  {'elapsed':>9}")
+
+    try:
+        for pool_size in args.pool_sizes:
+            rate, elapsed = await bench_pool(base_url, pool_size, args.messages, config)
+            print(f"{pool_size:>6}  {rate:>10.1f}  {elapsed:>8.2f}s")
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    print(f"{'='*60}\n")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Local Bot API stand-in for throughput tests")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    for name in ('serve', 'bench'):
+        cmd = sub.add_parser(name)
+        cmd.add_argument('--host', default="127.0.0.1")
+        cmd.add_argument('--port', type=int, default=8081 if name == 'serve' else 0)
+        cmd.add_argument('--latency', type=float, default=50, help="per-call latency in ms")
+        cmd.add_argument('--jitter', type=float, default=0, help="extra random latency in ms")
+
+    serve = sub.choices['serve']
+    serve.add_argument('--max-poll', type=float, default=1.0, help="cap on getUpdates long poll in seconds")
+
+    bench = sub.choices['bench']
+    bench.add_argument('--url', help="benchmark an already running stand-in instead")
+    bench.add_argument('--pool-sizes', type=lambda v: [int(x) for x in v.split(',')], default=[1, 8, 32, 256])
+    bench.add_argument('--messages', type=int, default=1000)
+    bench.add_argument('--keepalive', type=float, default=CONFIG['HTTP_KEEPALIVE'])
+    bench.add_argument('--http-version', default=CONFIG['HTTP_VERSION'])
+
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+
+    if args.command == 'bench':
+        asyncio.run(run_bench(args))
+        return
+
+    server = StandinServer(
+        (args.host, args.port),
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        max_poll=args.max_poll
+    )
+    print(f"Bot API stand-in on http://{args.host}:{args.port} ({args.latency:.0f}ms latency)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"Calls: {server.calls}")
+
+if __name__ == '__main__':
+    main()